@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from blrec import __github__, __prog__, __version__
 from blrec.bili.helpers import get_quality_name
 from blrec.bili.live import Live
+from blrec.bili.models import RoomInfo, UserInfo
 
 if TYPE_CHECKING:
     from .stream_recorder_impl import StreamRecorderImpl
@@ -14,37 +15,78 @@ if TYPE_CHECKING:
 __all__ = ('MetadataProvider',)
 
 
+_TZ = timezone(timedelta(hours=8))
+_RECORDER = f'{__prog__} v{__version__} {__github__}'
+
+
 class MetadataProvider:
     def __init__(self, live: Live, stream_recorder: StreamRecorderImpl) -> None:
         super().__init__()
         self._live = live
         self._stream_recorder = stream_recorder
+        self._room_info: Optional[RoomInfo] = None
+        self._user_info: Optional[UserInfo] = None
+        self._static_metadata: Dict[str, Any] = {}
+        self._static_comment: str = ''
+        self._static_description: Dict[str, str] = {}
 
     def __call__(self, original_metadata: Dict[str, Any]) -> Dict[str, Any]:
         return self._make_metadata(original_metadata)
 
+    def _update_static_metadata(self) -> None:
+        # room info and user info are frozen and get replaced on changes,
+        # so an identity check is enough to tell whether they are stale.
+        room_info = self._live.room_info
+        user_info = self._live.user_info
+        if room_info is self._room_info and user_info is self._user_info:
+            return
+
+        live_start_time = datetime.fromtimestamp(room_info.live_start_time, _TZ)
+        self._static_metadata = {
+            'Title': room_info.title,
+            'Artist': user_info.name,
+            'Date': str(live_start_time),
+        }
+        self._static_comment = f'''\
+B站直播录像
+主播：{user_info.name}
+标题：{room_info.title}
+分区：{room_info.parent_area_name} - {room_info.area_name}
+房间号：{room_info.room_id}
+开播时间：{live_start_time}
+'''
+        self._static_description = {
+            'UserId': str(user_info.uid),
+            'UserName': user_info.name,
+            'RoomId': str(room_info.room_id),
+            'RoomTitle': room_info.title,
+            'Area': room_info.area_name,
+            'ParentArea': room_info.parent_area_name,
+            'LiveStartTime': str(live_start_time),
+        }
+        self._room_info = room_info
+        self._user_info = user_info
+
     def _make_metadata(self, original_metadata: Dict[str, Any]) -> Dict[str, Any]:
-        tz = timezone(timedelta(hours=8))
-        live_start_time = datetime.fromtimestamp(
-            self._live.room_info.live_start_time, tz
-        )
+        self._update_static_metadata()
+
         if self._stream_recorder.stream_available_time is None:
             stream_available_time: Union[datetime, str] = 'N/A'
         else:
             stream_available_time = datetime.fromtimestamp(
-                self._stream_recorder.stream_available_time, tz
+                self._stream_recorder.stream_available_time, _TZ
             )
         if self._stream_recorder.hls_stream_available_time is None:
             hls_stream_available_time: Union[datetime, str] = 'N/A'
         else:
             hls_stream_available_time = datetime.fromtimestamp(
-                self._stream_recorder.hls_stream_available_time, tz
+                self._stream_recorder.hls_stream_available_time, _TZ
             )
         if self._stream_recorder.record_start_time is None:
             record_start_time: Union[datetime, str] = 'N/A'
         else:
             record_start_time = datetime.fromtimestamp(
-                self._stream_recorder.record_start_time, tz
+                self._stream_recorder.record_start_time, _TZ
             )
 
         assert self._stream_recorder.real_quality_number is not None
@@ -55,39 +97,27 @@ class MetadataProvider:
         )
 
         return {
-            'Title': self._live.room_info.title,
-            'Artist': self._live.user_info.name,
-            'Date': str(live_start_time),
-            'Comment': f'''\
-B站直播录像
-主播：{self._live.user_info.name}
-标题：{self._live.room_info.title}
-分区：{self._live.room_info.parent_area_name} - {self._live.room_info.area_name}
-房间号：{self._live.room_info.room_id}
-开播时间：{live_start_time}
+            **self._static_metadata,
+            'Comment': self._static_comment
+            + f'''\
 开始推流时间: {stream_available_time}
 HLS流可用时间: {hls_stream_available_time}
 录播起始时间: {record_start_time}
 流主机: {self._stream_recorder.stream_host}
 流格式：{self._stream_recorder.stream_format}
 流画质：{stream_quality}
-录制程序：{__prog__} v{__version__} {__github__}''',
+录制程序：{_RECORDER}''',
+            # keep OrderedDict, the AMF writer encodes it as an ECMA array
             'description': OrderedDict(
                 {
-                    'UserId': str(self._live.user_info.uid),
-                    'UserName': self._live.user_info.name,
-                    'RoomId': str(self._live.room_info.room_id),
-                    'RoomTitle': self._live.room_info.title,
-                    'Area': self._live.room_info.area_name,
-                    'ParentArea': self._live.room_info.parent_area_name,
-                    'LiveStartTime': str(live_start_time),
+                    **self._static_description,
                     'StreamAvailableTime': str(stream_available_time),
                     'HLSStreamAvailableTime': str(hls_stream_available_time),
                     'RecordStartTime': str(record_start_time),
                     'StreamHost': self._stream_recorder.stream_host,
                     'StreamFormat': self._stream_recorder.stream_format,
                     'StreamQuality': stream_quality,
-                    'Recorder': f'{__prog__} v{__version__} {__github__}',
+                    'Recorder': _RECORDER,
                 }
             ),
         }
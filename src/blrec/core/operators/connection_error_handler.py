@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Optional, TypeVar
 
@@ -16,6 +17,10 @@ __all__ = ('ConnectionErrorHandler',)
 
 
 _T = TypeVar('_T')
+_CONNECTION_ERRORS = (
+    aiohttp.ClientConnectionError,
+    requests.exceptions.ConnectionError,
+)
 
 
 class ConnectionErrorHandler(AsyncCooperationMixin):
@@ -42,20 +47,14 @@ class ConnectionErrorHandler(AsyncCooperationMixin):
             scheduler: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
             def on_error(exc: Exception) -> None:
-                try:
-                    raise exc
-                except (
-                    aiohttp.ClientConnectionError,
-                    requests.exceptions.ConnectionError,
-                ) as e:
-                    logger.warning(repr(e))
+                if isinstance(exc, _CONNECTION_ERRORS):
+                    logger.warning(repr(exc))
                     if self._wait_for_connection_error():
                         observer.on_error(exc)
                     else:
                         observer.on_completed()
-                except Exception:
-                    pass
-                observer.on_error(exc)
+                else:
+                    observer.on_error(exc)
 
             return source.subscribe(
                 observer.on_next, on_error, observer.on_completed, scheduler=scheduler
@@ -64,9 +63,7 @@ class ConnectionErrorHandler(AsyncCooperationMixin):
         return Observable(subscribe)
 
     def _should_retry(self, exc: Exception) -> bool:
-        if isinstance(
-            exc, (aiohttp.ClientConnectionError, requests.exceptions.ConnectionError)
-        ):
+        if isinstance(exc, _CONNECTION_ERRORS):
             return True
         else:
             return False
@@ -74,12 +71,21 @@ class ConnectionErrorHandler(AsyncCooperationMixin):
     def _wait_for_connection_error(self) -> bool:
         timeout = self.disconnection_timeout
         logger.info(f'Waiting {timeout} seconds for connection recovery... ')
-        timebase = time.monotonic()
-        while not self._call_coroutine(self._live.check_connectivity()):
-            if timeout is not None and time.monotonic() - timebase > timeout:
-                logger.error(f'Connection not recovered in {timeout} seconds')
-                return False
-            time.sleep(self.check_interval)
-        else:
+        if self._call_coroutine(self._wait_for_connectivity(timeout)):
             logger.info('Connection recovered')
             return True
+        else:
+            logger.error(f'Connection not recovered in {timeout} seconds')
+            return False
+
+    async def _wait_for_connectivity(self, timeout: Optional[float]) -> bool:
+        # poll quickly at first then back off to the check interval,
+        # all within a single coroutine instead of one per check.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 1.0
+        while not await self._live.check_connectivity():
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.check_interval)
+        return True
@@ -28,25 +28,23 @@ class ExceptionHandler(AsyncCooperationMixin):
         ) -> abc.DisposableBase:
             def on_error(exc: Exception) -> None:
                 self._submit_exception(exc)
-                try:
-                    raise exc
-                except OSError as e:
+                if isinstance(exc, OSError):
                     logger.critical('{}\n{}', repr(exc), format_exception(exc))
-                    if e.errno == errno.ENOSPC:
+                    if exc.errno == errno.ENOSPC:
                         # OSError(28, 'No space left on device')
                         observer.on_completed()
                     else:
                         observer.on_error(exc)
-                except LiveRoomHidden:
+                elif isinstance(exc, LiveRoomHidden):
                     logger.error('The live room has been hidden!')
                     observer.on_completed()
-                except LiveRoomLocked:
+                elif isinstance(exc, LiveRoomLocked):
                     logger.error('The live room has been locked!')
                     observer.on_completed()
-                except LiveRoomEncrypted:
+                elif isinstance(exc, LiveRoomEncrypted):
                     logger.error('The live room has been encrypted!')
                     observer.on_completed()
-                except Exception:
+                else:
                     observer.on_error(exc)
 
             return source.subscribe(
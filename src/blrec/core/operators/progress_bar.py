@@ -34,14 +34,15 @@ class ProgressBar:
         ) -> abc.DisposableBase:
             subscription = SerialDisposable()
 
-            self._pbar = tqdm(
-                desc='Recording',
-                unit='B',
-                unit_scale=True,
-                unit_divisor=1024,
-                postfix=self._make_pbar_postfix(),
-                disable=not DISPLAY_PROGRESS,
-            )
+            if DISPLAY_PROGRESS:
+                self._pbar = tqdm(
+                    desc='Recording',
+                    unit='B',
+                    unit_scale=True,
+                    unit_divisor=1024,
+                    mininterval=0.5,
+                    postfix=self._make_pbar_postfix(),
+                )
 
             def on_next(item: FLVStreamItem) -> None:
                 if self._pbar is not None:
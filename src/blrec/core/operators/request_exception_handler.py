@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
 from typing import Optional, TypeVar
 
@@ -19,11 +20,19 @@ __all__ = ('RequestExceptionHandler',)
 
 _T = TypeVar('_T')
 
+_RETRIABLE_TYPES = (
+    requests.exceptions.RequestException,  # XXX: ConnectionError
+    urllib3.exceptions.HTTPError,
+    asyncio.exceptions.TimeoutError,
+    aiohttp.ClientError,
+)
+
 
 class RequestExceptionHandler:
     def __init__(self, stream_url_resolver: core_ops.StreamURLResolver) -> None:
         self._stream_url_resolver = stream_url_resolver
         self._last_retry_time = time.monotonic()
+        self._failures: int = 0
 
     def __call__(self, source: Observable[_T]) -> Observable[_T]:
         return self._handle(source).pipe(
@@ -36,46 +45,39 @@ class RequestExceptionHandler:
             observer: abc.ObserverBase[_T],
             scheduler: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
-            def on_error(exc: Exception) -> None:
-                try:
-                    raise exc
-                except requests.exceptions.RequestException:  # XXX: ConnectionError
-                    logger.warning(repr(exc))
-                except urllib3.exceptions.HTTPError:
-                    logger.warning(repr(exc))
-                except asyncio.exceptions.TimeoutError:
-                    logger.warning(repr(exc))
-                except aiohttp.ClientError:
-                    logger.warning(repr(exc))
-                except Exception:
-                    pass
+            def on_next(item: _T) -> None:
+                self._failures = 0
+                observer.on_next(item)
 
+            def on_error(exc: Exception) -> None:
                 if self._should_retry(exc):
-                    if time.monotonic() - self._last_retry_time < 1:
-                        time.sleep(1)
-                    self._last_retry_time = time.monotonic()
+                    logger.warning('{!r}', exc)
+                    delay = self._backoff_delay()
+                    self._failures += 1
+                    now = time.monotonic()
+                    elapsed = now - self._last_retry_time
+                    if elapsed < delay:
+                        time.sleep(delay - elapsed)
+                        now = time.monotonic()
+                    self._last_retry_time = now
 
                 observer.on_error(exc)
 
             return source.subscribe(
-                observer.on_next, on_error, observer.on_completed, scheduler=scheduler
+                on_next, on_error, observer.on_completed, scheduler=scheduler
             )
 
         return Observable(subscribe)
 
+    def _backoff_delay(self) -> float:
+        # exponential backoff from 1 s up to a few seconds since it sleeps on
+        # the recording thread, jitter keeps recorders failing at the same time
+        # from retrying in lockstep.
+        delay = min(5.0, 2.0 ** min(self._failures, 3))
+        return delay + random.uniform(0, 0.1 * delay)
+
     def _should_retry(self, exc: Exception) -> bool:
-        if isinstance(
-            exc,
-            (
-                requests.exceptions.RequestException,  # XXX: ConnectionError
-                urllib3.exceptions.HTTPError,
-                asyncio.exceptions.TimeoutError,
-                aiohttp.ClientError,
-            ),
-        ):
-            return True
-        else:
-            return False
+        return isinstance(exc, _RETRIABLE_TYPES)
 
     def _before_retry(self, exc: Exception) -> None:
         if isinstance(
@@ -46,7 +46,7 @@ class StreamFetcher(AsyncCooperationMixin):
                     logger.info('Response received')
                     response.raise_for_status()
                 except Exception as e:
-                    logger.warning(f'Failed to request live stream: {repr(e)}')
+                    logger.warning('Failed to request live stream: {!r}', e)
                     observer.on_error(e)
                 else:
                     observer.on_next(response.raw)  # urllib3.response.HTTPResponse
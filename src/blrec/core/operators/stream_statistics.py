@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import io
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from reactivex import Observable, Subject, abc
+from reactivex import Observable, abc
 
 from ..statistics import Statistics
 
@@ -42,8 +42,9 @@ class StreamStatistics:
             scheduler: Optional[abc.SchedulerBase] = None,
         ) -> abc.DisposableBase:
             def on_next(stream: io.RawIOBase) -> None:
-                calculable_stream = CalculableStream(stream)
-                calculable_stream.size_updates.subscribe(self._statistics.submit)
+                calculable_stream = CalculableStream(
+                    stream, on_size=self._statistics.submit
+                )
                 observer.on_next(calculable_stream)
 
             def on_completed() -> None:
@@ -58,27 +59,26 @@ class StreamStatistics:
 
 
 class CalculableStream(io.RawIOBase):
-    def __init__(self, stream: io.RawIOBase) -> None:
+    def __init__(
+        self, stream: io.RawIOBase, on_size: Optional[Callable[[int], None]] = None
+    ) -> None:
         self._stream = stream
         self._offset: int = 0
-        self._size_updates: Subject[int] = Subject()
-
-    @property
-    def size_updates(self) -> Observable[int]:
-        return self._size_updates
+        # called directly on every read, there is only ever one consumer
+        self._on_size = on_size or (lambda size: None)
 
     def read(self, size: int = -1) -> bytes:
         data = self._stream.read(size)
         assert data is not None
         self._offset += len(data)
-        self._size_updates.on_next(len(data))
+        self._on_size(len(data))
         return data
 
     def readinto(self, b: Any) -> int:
         n = self._stream.readinto(b)
         assert n is not None
         self._offset += n
-        self._size_updates.on_next(n)
+        self._on_size(n)
         return n
 
     def tell(self) -> int:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import random
+import time
 from typing import Final, Optional
 from urllib.parse import urlparse
 
@@ -9,9 +11,6 @@ from reactivex import Observable, abc
 from reactivex import operators as ops
 
 from blrec.bili.exceptions import (
-    LiveRoomEncrypted,
-    LiveRoomHidden,
-    LiveRoomLocked,
     NoAlternativeStreamAvailable,
     NoStreamAvailable,
     NoStreamCodecAvailable,
@@ -28,8 +27,23 @@ from ..stream_param_holder import StreamParamHolder, StreamParams
 __all__ = ('StreamURLResolver',)
 
 
+# leaf exception types raised by Live.get_live_stream_url
+_RETRIABLE_TYPES = frozenset(
+    (
+        NoStreamAvailable,
+        NoStreamCodecAvailable,
+        NoStreamFormatAvailable,
+        NoStreamQualityAvailable,
+        NoAlternativeStreamAvailable,
+    )
+)
+
+
 class StreamURLResolver(AsyncCooperationMixin):
     _MAX_ATTEMPTS_FOR_NO_STREAM: Final[int] = 10
+    # how long a successful probe of the stream url is trusted
+    _PROBE_TTL: Final[float] = 5.0
+    _MAX_RETRY_DELAY: Final[float] = 10.0
 
     def __init__(
         self,
@@ -47,6 +61,8 @@ class StreamURLResolver(AsyncCooperationMixin):
         self._stream_host: str = ''
         self._stream_params: Optional[StreamParams] = None
         self._attempts_for_no_stream: int = 0
+        self._last_probe_time: float = 0.0
+        self._failures: int = 0
 
     @property
     def stream_url(self) -> str:
@@ -69,6 +85,8 @@ class StreamURLResolver(AsyncCooperationMixin):
         self._stream_host = ''
         self._stream_params = None
         self._attempts_for_no_stream = 0
+        self._last_probe_time = 0.0
+        self._failures = 0
 
     def rotate_routes(self) -> None:
         self.use_alternative_stream = not self.use_alternative_stream
@@ -77,7 +95,7 @@ class StreamURLResolver(AsyncCooperationMixin):
         self.reset()
         return self._solve(source).pipe(  # type: ignore
             ops.do_action(on_error=self._before_retry),
-            utils_ops.retry(delay=1, should_retry=self._should_retry),
+            utils_ops.retry(delay=self._retry_delay, should_retry=self._should_retry),
         )
 
     def _solve(self, source: Observable[StreamParams]) -> Observable[str]:
@@ -92,11 +110,13 @@ class StreamURLResolver(AsyncCooperationMixin):
 
                 try:
                     logger.info(
-                        f'Getting the live stream url... '
-                        f'qn: {params.quality_number}, '
-                        f'format: {params.stream_format}, '
-                        f'api platform: {params.api_platform}, '
-                        f'use alternative stream: {params.use_alternative_stream}'
+                        'Getting the live stream url... '
+                        'qn: {}, format: {}, api platform: {}, '
+                        'use alternative stream: {}',
+                        params.quality_number,
+                        params.stream_format,
+                        params.api_platform,
+                        params.use_alternative_stream,
                     )
                     url = self._call_coroutine(
                         self._live.get_live_stream_url(
@@ -107,14 +127,16 @@ class StreamURLResolver(AsyncCooperationMixin):
                         )
                     )
                 except Exception as e:
-                    logger.warning(f'Failed to get live stream url: {repr(e)}')
+                    logger.warning('Failed to get live stream url: {!r}', e)
                     observer.on_error(e)
                 else:
-                    logger.info(f"Got live stream url: '{url}'")
+                    logger.info("Got live stream url: '{}'", url)
                     self._stream_url = url
                     self._stream_host = urlparse(url).hostname or ''
                     self._stream_params = params
                     self._attempts_for_no_stream = 0
+                    self._last_probe_time = 0.0
+                    self._failures = 0
                     observer.on_next(url)
 
             return source.subscribe(
@@ -125,63 +147,65 @@ class StreamURLResolver(AsyncCooperationMixin):
 
     def _can_resue_url(self, params: StreamParams) -> bool:
         if params == self._stream_params and self._stream_url:
+            if time.monotonic() - self._last_probe_time < self._PROBE_TTL:
+                return True
             try:
-                response = self._session.get(
-                    self._stream_url, stream=True, headers=self._live.headers, timeout=3
-                )
-                response.raise_for_status()
+                self._probe_url(self._stream_url)
             except Exception:
                 return False
             else:
+                self._last_probe_time = time.monotonic()
                 return True
         else:
             return False
 
+    def _probe_url(self, url: str) -> None:
+        # a HEAD request transfers no body and leaves the pooled connection
+        # reusable, fall back to GET for servers that don't allow HEAD.
+        with self._session.head(
+            url, headers=self._live.headers, timeout=3, allow_redirects=True
+        ) as response:
+            if response.status_code not in (405, 501):
+                response.raise_for_status()
+                return
+        with self._session.get(
+            url, stream=True, headers=self._live.headers, timeout=3
+        ) as response:
+            response.raise_for_status()
+
+    def _retry_delay(self) -> float:
+        # full jitter backoff so that rooms waiting for a stream don't hit
+        # the api in lockstep
+        delay = min(self._MAX_RETRY_DELAY, 2 ** min(self._failures, 4))
+        self._failures += 1
+        return random.uniform(0, delay)
+
     def _should_retry(self, exc: Exception) -> bool:
-        if isinstance(
-            exc,
-            (
-                NoStreamAvailable,
-                NoStreamCodecAvailable,
-                NoStreamFormatAvailable,
-                NoStreamQualityAvailable,
-                NoAlternativeStreamAvailable,
-            ),
-        ):
-            return True
-        else:
-            return False
+        return type(exc) in _RETRIABLE_TYPES
 
     def _before_retry(self, exc: Exception) -> None:
-        try:
-            raise exc
-        except (NoStreamAvailable, NoStreamCodecAvailable, NoStreamFormatAvailable):
+        if isinstance(
+            exc, (NoStreamAvailable, NoStreamCodecAvailable, NoStreamFormatAvailable)
+        ):
             self._attempts_for_no_stream += 1
             if self._attempts_for_no_stream > self._MAX_ATTEMPTS_FOR_NO_STREAM:
                 self._run_coroutine(self._live_monitor.check_live_status())
                 self._attempts_for_no_stream = 0
-        except NoStreamQualityAvailable:
+        elif isinstance(exc, NoStreamQualityAvailable):
             qn = self._stream_param_holder.quality_number
             if qn == 10000:
                 logger.warning('The original stream quality (10000) is not available')
             else:
                 logger.info(
-                    f'The specified stream quality ({qn}) is not available, '
-                    'will using the original stream quality (10000) instead.'
+                    'The specified stream quality ({}) is not available, '
+                    'will using the original stream quality (10000) instead.',
+                    qn,
                 )
                 self._stream_param_holder.fall_back_quality()
-        except NoAlternativeStreamAvailable:
+        elif isinstance(exc, NoAlternativeStreamAvailable):
             logger.debug(
                 'No alternative stream url available, '
                 'will using the primary stream url instead.'
             )
             self._stream_param_holder.use_alternative_stream = False
             # self._stream_param_holder.rotate_api_platform()  # XXX: use web api only
-        except LiveRoomHidden:
-            pass
-        except LiveRoomLocked:
-            pass
-        except LiveRoomEncrypted:
-            pass
-        except Exception:
-            pass
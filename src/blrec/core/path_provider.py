@@ -1,3 +1,4 @@
+import glob
 import os
 import re
 from datetime import datetime
@@ -10,6 +11,9 @@ from blrec.utils.mixins import AsyncCooperationMixin
 __all__ = ('PathProvider',)
 
 
+_SUFFIX_PATTERN = re.compile(r'_\((\d+)\)$')
+
+
 class PathProvider(AsyncCooperationMixin):
     def __init__(self, live: Live, out_dir: str, path_template: str) -> None:
         super().__init__()
@@ -25,31 +29,41 @@ class PathProvider(AsyncCooperationMixin):
 
     def _make_path(self, timestamp: int) -> str:
         date_time = datetime.fromtimestamp(timestamp)
+        month, day, hour, minute, second = date_time.strftime('%m %d %H %M %S').split()
+        room_info = self._live.room_info
         relpath = self.path_template.format(
             roomid=self._live.room_id,
             uname=escape_path(self._live.user_info.name),
-            title=escape_path(self._live.room_info.title),
-            area=escape_path(self._live.room_info.area_name),
-            parent_area=escape_path(self._live.room_info.parent_area_name),
+            title=escape_path(room_info.title),
+            area=escape_path(room_info.area_name),
+            parent_area=escape_path(room_info.parent_area_name),
             year=date_time.year,
-            month=str(date_time.month).rjust(2, '0'),
-            day=str(date_time.day).rjust(2, '0'),
-            hour=str(date_time.hour).rjust(2, '0'),
-            minute=str(date_time.minute).rjust(2, '0'),
-            second=str(date_time.second).rjust(2, '0'),
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            second=second,
         )
 
         pathname = os.path.abspath(
             os.path.expanduser(os.path.join(self.out_dir, relpath) + '.flv')
         )
         os.makedirs(os.path.dirname(pathname), exist_ok=True)
-        while os.path.exists(pathname):
+        if os.path.exists(pathname):
             root, ext = os.path.splitext(pathname)
-            m = re.search(r'_\((\d+)\)$', root)
-            if m is None:
-                root += '_(1)'
-            else:
-                root = re.sub(r'\(\d+\)$', f'({int(m.group(1)) + 1})', root)
-            pathname = root + ext
+            # look up the taken suffixes at once instead of probing them one by one
+            index = self._max_suffix_index(root, ext) + 1
+            pathname = f'{root}_({index}){ext}'
+            while os.path.exists(pathname):
+                index += 1
+                pathname = f'{root}_({index}){ext}'
 
         return pathname
+
+    def _max_suffix_index(self, root: str, ext: str) -> int:
+        indices = []
+        for path in glob.iglob(glob.escape(root) + '_(*)' + glob.escape(ext)):
+            m = _SUFFIX_PATTERN.search(os.path.splitext(path)[0])
+            if m is not None and m.start() == len(root):
+                indices.append(int(m.group(1)))
+        return max(indices, default=0)
@@ -1,12 +1,12 @@
 import asyncio
 import json
+from asyncio import QueueEmpty
 from contextlib import suppress
-from threading import Lock
+from typing import Final
 
 import aiofiles
 from aiofiles.threadpool.text import AsyncTextIOWrapper
 from loguru import logger
-from tenacity import AsyncRetrying, retry_if_not_exception_type, stop_after_attempt
 
 from blrec.bili.live import Live
 from blrec.event.event_emitter import EventEmitter, EventListener
@@ -21,6 +21,10 @@ from .stream_recorder import StreamRecorder, StreamRecorderEventListener
 __all__ = 'RawDanmakuDumper', 'RawDanmakuDumperEventListener'
 
 
+# json.dumps() creates a new encoder per call when given any options
+_json_encoder = json.JSONEncoder(ensure_ascii=False)
+
+
 class RawDanmakuDumperEventListener(EventListener):
     async def on_raw_danmaku_file_created(self, path: str) -> None:
         ...
@@ -34,6 +38,9 @@ class RawDanmakuDumper(
     StreamRecorderEventListener,
     SwitchableMixin,
 ):
+    _MAX_ATTEMPTS: Final[int] = 3
+    _MAX_BATCH_SIZE: Final[int] = 64
+
     def __init__(
         self,
         live: Live,
@@ -45,7 +52,9 @@ class RawDanmakuDumper(
         self._logger = logger.bind(**self._logger_context)
         self._stream_recorder = stream_recorder
         self._receiver = danmaku_receiver
-        self._lock: Lock = Lock()
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # the batch being written, kept until the write succeeds
+        self._unwritten: str = ''
 
     def _do_enable(self) -> None:
         self._stream_recorder.add_listener(self)
@@ -59,13 +68,13 @@ class RawDanmakuDumper(
     async def on_video_file_created(
         self, video_path: str, record_start_time: int
     ) -> None:
-        with self._lock:
+        async with self._lock:
             self._path = raw_danmaku_path(video_path)
             await self._stop_dumping()
             self._start_dumping()
 
     async def on_video_file_completed(self, video_path: str) -> None:
-        with self._lock:
+        async with self._lock:
             await self._stop_dumping()
 
     def _start_dumping(self) -> None:
@@ -88,25 +97,19 @@ class RawDanmakuDumper(
     @async_task_with_logger_context
     async def _do_dump(self) -> None:
         self._logger.debug('Started dumping raw danmaku')
+        self._unwritten = ''
         try:
             async with aiofiles.open(self._path, 'wt', encoding='utf8') as f:
                 self._logger.info(f"Raw danmaku file created: '{self._path}'")
                 await self._emit('raw_danmaku_file_created', self._path)
 
-                async for attempt in AsyncRetrying(
-                    retry=retry_if_not_exception_type((asyncio.CancelledError)),
-                    stop=stop_after_attempt(3),
-                ):
-                    with attempt:
-                        try:
-                            await self._dumping_loop(f)
-                        except Exception as e:
-                            submit_exception(e)
+                for attempts in range(1, self._MAX_ATTEMPTS + 1):
+                    try:
+                        await self._dumping_loop(f)
+                    except Exception as e:
+                        submit_exception(e)
+                        if attempts == self._MAX_ATTEMPTS:
                             raise
-                while True:
-                    danmu = await self._receiver.get_raw_danmaku()
-                    json_string = json.dumps(danmu, ensure_ascii=False)
-                    await f.write(json_string + '\n')
         finally:
             self._logger.info(f"Raw danmaku file completed: '{self._path}'")
             await self._emit('raw_danmaku_file_completed', self._path)
@@ -114,6 +117,16 @@ class RawDanmakuDumper(
 
     async def _dumping_loop(self, file: AsyncTextIOWrapper) -> None:
         while True:
-            danmu = await self._receiver.get_raw_danmaku()
-            json_string = json.dumps(danmu, ensure_ascii=False)
-            await file.write(json_string + '\n')
+            # a batch whose write failed is written again on the next attempt
+            if not self._unwritten:
+                danmu = await self._receiver.get_raw_danmaku()
+                lines = [_json_encoder.encode(danmu)]
+                # write the danmaku already queued up along with it in one go
+                with suppress(QueueEmpty):
+                    while len(lines) < self._MAX_BATCH_SIZE:
+                        danmu = self._receiver.get_raw_danmaku_nowait()
+                        lines.append(_json_encoder.encode(danmu))
+                lines.append('')  # terminate the last line too
+                self._unwritten = '\n'.join(lines)
+            await file.write(self._unwritten)
+            self._unwritten = ''
@@ -1,5 +1,6 @@
-from asyncio import Queue, QueueFull
-from typing import Final
+from asyncio import Event, QueueEmpty
+from collections import deque
+from typing import Deque, Final
 
 from loguru import logger
 
@@ -18,7 +19,9 @@ class RawDanmakuReceiver(DanmakuListener, StoppableMixin):
         super().__init__()
         self._logger = logger.bind(room_id=live.room_id)
         self._danmaku_client = danmaku_client
-        self._queue: Queue[Danmaku] = Queue(maxsize=self._MAX_QUEUE_SIZE)
+        # a ring buffer, the oldest danmaku is discarded when it's full
+        self._queue: Deque[Danmaku] = deque(maxlen=self._MAX_QUEUE_SIZE)
+        self._not_empty = Event()
 
     def _do_start(self) -> None:
         self._danmaku_client.add_listener(self)
@@ -30,14 +33,20 @@ class RawDanmakuReceiver(DanmakuListener, StoppableMixin):
         self._logger.debug('Stopped raw danmaku receiver')
 
     async def get_raw_danmaku(self) -> Danmaku:
-        return await self._queue.get()
+        while not self._queue:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._queue.popleft()
 
-    async def on_danmaku_received(self, danmu: Danmaku) -> None:
+    def get_raw_danmaku_nowait(self) -> Danmaku:
         try:
-            self._queue.put_nowait(danmu)
-        except QueueFull:
-            self._queue.get_nowait()  # discard the first item
-            self._queue.put_nowait(danmu)
+            return self._queue.popleft()
+        except IndexError:
+            raise QueueEmpty from None
+
+    async def on_danmaku_received(self, danmu: Danmaku) -> None:
+        self._queue.append(danmu)
+        self._not_empty.set()
 
     def _clear_queue(self) -> None:
-        self._queue = Queue(maxsize=self._MAX_QUEUE_SIZE)
+        self._queue.clear()
@@ -540,7 +540,7 @@ description      :
         msg = f"""
 ================================= Room Change =================================
 title            : {room_info.title}
-area id          ：{room_info.area_id}
+area id          : {room_info.area_id}
 area name        : {room_info.area_name}
 parent area id   : {room_info.parent_area_id}
 parent area name : {room_info.parent_area_name}
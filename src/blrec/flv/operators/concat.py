@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import deque
 from enum import IntEnum, auto
-from typing import Callable, List, Optional, TypedDict, cast
+from itertools import islice
+from typing import Callable, Deque, List, Optional, TypedDict, cast
 
 import attr
 from loguru import logger
@@ -88,7 +90,7 @@ def concat(
 
             delta: int = 0
             action: ACTION = ACTION.NOOP
-            last_tags: List[FlvTag] = []
+            last_tags: Deque[FlvTag] = deque(maxlen=num_of_last_tags)
             gathered_tags: List[FlvTag] = []
             last_flv_header: Optional[FlvHeader] = None
             last_audio_sequence_header: Optional[AudioTag] = None
@@ -104,7 +106,7 @@ def concat(
                 nonlocal last_video_sequence_header
                 delta = 0
                 action = ACTION.NOOP
-                last_tags = []
+                last_tags = deque(maxlen=num_of_last_tags)
                 gathered_tags = []
                 last_flv_header = None
                 last_audio_sequence_header = None
@@ -113,8 +115,6 @@ def concat(
             def update_last_tags(tag: FlvTag) -> None:
                 nonlocal last_audio_sequence_header, last_video_sequence_header
                 last_tags.append(tag)
-                if len(last_tags) > num_of_last_tags:
-                    last_tags.pop(0)
                 if is_audio_sequence_header(tag):
                     last_audio_sequence_header = tag
                 elif is_video_sequence_header(tag):
@@ -173,7 +173,7 @@ def concat(
                             lambda t: t[0].is_the_same_as(t[1]),
                             zip(
                                 tags[max(0, idx - (len(last_tags) - 1)) : idx],
-                                last_tags[:-1],
+                                islice(last_tags, len(last_tags) - 1),
                             ),
                         )
                     ):
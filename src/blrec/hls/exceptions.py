@@ -8,3 +8,7 @@ class NoNewSegments(Exception):
 
 class FetchSegmentError(Exception):
     pass
+
+
+class CircuitOpenError(Exception):
+    pass
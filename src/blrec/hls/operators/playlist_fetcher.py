@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import time
 from datetime import datetime
+from threading import Event
 from typing import Optional
 
 import m3u8
@@ -10,7 +11,6 @@ import urllib3
 from loguru import logger
 from reactivex import Observable, abc
 from reactivex.disposable import CompositeDisposable, Disposable, SerialDisposable
-from tenacity import retry, retry_if_exception_type, stop_after_delay, wait_exponential
 
 from blrec.bili.live import Live
 from blrec.utils.mixins import SupportDebugMixin
@@ -41,33 +41,46 @@ class PlaylistFetcher(SupportDebugMixin):
                 )
                 playlist_debug_file = open(path, 'wt', encoding='utf-8')
 
-            disposed = False
+            disposed = Event()
             subscription = SerialDisposable()
 
             def on_next(url: str) -> None:
                 logger.info(f'Fetching playlist... {url}')
+                last_content: str = ''
+                last_playlist: Optional[m3u8.M3U8] = None
 
-                while not disposed:
+                while not disposed.is_set():
+                    start_time = time.monotonic()
                     try:
                         content = self._fetch_playlist(url)
                     except Exception as e:
-                        logger.warning(f'Failed to fetch playlist: {repr(e)}')
+                        logger.warning('Failed to fetch playlist: {!r}', e)
                         observer.on_error(e)
                     else:
                         if self._debug:
                             playlist_debug_file.write(content + '\n')
-                        playlist = m3u8.loads(content, uri=url)
+                        if content == last_content and last_playlist is not None:
+                            # the playlist has not been updated, skip parsing it
+                            playlist = last_playlist
+                        else:
+                            playlist = m3u8.loads(content, uri=url)
+                            last_content = content
+                            last_playlist = playlist
                         if playlist.is_variant:
                             url = self._get_best_quality_url(playlist)
                             logger.debug('Playlist changed to variant playlist')
                             on_next(url)
                         else:
                             observer.on_next(playlist)
-                            time.sleep(1)
+                            # the time spent on fetching and parsing counts
+                            # toward the interval so polls keep a steady pace
+                            elapsed = time.monotonic() - start_time
+                            interval = self._poll_interval_of(playlist)
+                            if elapsed < interval:
+                                disposed.wait(interval - elapsed)
 
             def dispose() -> None:
-                nonlocal disposed
-                disposed = True
+                disposed.set()
                 if self._debug:
                     playlist_debug_file.close()
 
@@ -79,31 +92,38 @@ class PlaylistFetcher(SupportDebugMixin):
 
         return Observable(subscribe)
 
+    def _poll_interval_of(self, playlist: m3u8.M3U8) -> float:
+        # refresh about twice per target duration, within sane bounds
+        target_duration = playlist.target_duration or 2
+        return max(1.0, min(3.0, target_duration / 2))
+
     def _get_best_quality_url(self, playlist: m3u8.M3U8) -> str:
-        sorted_playlists = sorted(
-            playlist.playlists, key=lambda p: p.stream_info.bandwidth
-        )
-        return sorted_playlists[-1].absolute_uri
-
-    @retry(
-        reraise=True,
-        retry=retry_if_exception_type(
-            (
-                requests.exceptions.Timeout,
-                urllib3.exceptions.TimeoutError,
-                urllib3.exceptions.ProtocolError,
-            )
-        ),
-        wait=wait_exponential(multiplier=0.1, max=1),
-        stop=stop_after_delay(8),
-    )
+        best = max(playlist.playlists, key=lambda p: p.stream_info.bandwidth)
+        return best.absolute_uri
+
     def _fetch_playlist(self, url: str) -> str:
-        try:
-            response = self._session.get(url, headers=self._live.headers, timeout=3)
-            response.raise_for_status()
-        except Exception as e:
-            logger.debug(f'Failed to fetch playlist: {repr(e)}')
-            raise
-        else:
-            response.encoding = 'utf-8'
-            return response.text
+        deadline = time.monotonic() + 8
+        delay = 0.1
+        while True:
+            try:
+                response = self._session.get(url, headers=self._live.headers, timeout=3)
+                response.raise_for_status()
+            except Exception as e:
+                logger.debug('Failed to fetch playlist: {!r}', e)
+                if (
+                    not isinstance(
+                        e,
+                        (
+                            requests.exceptions.Timeout,
+                            urllib3.exceptions.TimeoutError,
+                            urllib3.exceptions.ProtocolError,
+                        ),
+                    )
+                    or time.monotonic() >= deadline
+                ):
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 1)
+            else:
+                response.encoding = 'utf-8'
+                return response.text
@@ -52,32 +52,36 @@ class PlaylistResolver:
                 if playlist.media_sequence < self._last_media_sequence:
                     logger.warning(
                         'Segments discontinuous: '
-                        f'last media sequence: {self._last_media_sequence}, '
-                        f'current media sequence: {playlist.media_sequence}'
+                        'last media sequence: {}, current media sequence: {}',
+                        self._last_media_sequence,
+                        playlist.media_sequence,
                     )
                     discontinuity = True
                     self._last_sequence_number = None
                 self._last_media_sequence = playlist.media_sequence
 
+                last_number = self._last_sequence_number
                 new_segments = []
                 for seg in playlist.segments:
                     num = sequence_number_of(seg.uri)
-                    if self._last_sequence_number is not None:
-                        if num <= self._last_sequence_number:
+                    if last_number is not None:
+                        if num <= last_number:
                             continue
-                        if num == self._last_sequence_number + 1:
+                        if num == last_number + 1:
                             discontinuity = False
                         else:
                             logger.warning(
                                 'Segments discontinuous: '
-                                f'last sequence number: {self._last_sequence_number}, '
-                                f'current sequence number: {num}'
+                                'last sequence number: {}, current sequence number: {}',
+                                last_number,
+                                num,
                             )
                             discontinuity = True
                     seg.discontinuity = discontinuity
                     seg.custom_parser_values['playlist'] = playlist
                     new_segments.append(seg)
-                    self._last_sequence_number = num
+                    last_number = num
+                self._last_sequence_number = last_number
 
                 if not new_segments:
                     attempts += 1
@@ -88,8 +92,9 @@ class PlaylistResolver:
                 else:
                     attempts = 0
 
+                emit = observer.on_next
                 for seg in new_segments:
-                    observer.on_next(seg)
+                    emit(seg)
 
             def dispose() -> None:
                 nonlocal disposed
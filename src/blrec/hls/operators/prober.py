@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import io
+import contextvars
 from typing import List, Optional, Union
 
 from loguru import logger
 from reactivex import Observable, Subject, abc
 from reactivex.disposable import CompositeDisposable, Disposable, SerialDisposable
+from reactivex.scheduler import ThreadPoolScheduler
 
 from blrec.utils.ffprobe import StreamProfile, ffprobe_on
 
@@ -17,6 +18,7 @@ __all__ = ('Prober', 'StreamProfile')
 class Prober:
     def __init__(self) -> None:
         self._profiles: Subject[StreamProfile] = Subject()
+        self._scheduler = ThreadPoolScheduler(max_workers=1)
 
     def _reset(self) -> None:
         self._gathering: bool = False
@@ -75,14 +77,14 @@ class Prober:
         return Observable(subscribe)
 
     def _do_probe(self) -> None:
-        bytes_io = io.BytesIO()
-        for item in self._gathered_items:
-            bytes_io.write(item.payload)
+        data = b''.join(item.payload for item in self._gathered_items)
+        # ffprobe runs on the worker thread, keep the logger context there
+        context = contextvars.copy_context()
 
         def on_next(profile: StreamProfile) -> None:
-            self._profiles.on_next(profile)
+            context.run(self._profiles.on_next, profile)
 
         def on_error(e: Exception) -> None:
-            logger.warning(f'Failed to probe stream by ffprobe: {repr(e)}')
+            context.run(logger.warning, 'Failed to probe stream by ffprobe: {!r}', e)
 
-        ffprobe_on(bytes_io.getvalue()).subscribe(on_next, on_error)
+        ffprobe_on(data).subscribe(on_next, on_error, scheduler=self._scheduler)
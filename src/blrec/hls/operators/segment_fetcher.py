@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
 
 import attr
 import m3u8
@@ -11,14 +12,6 @@ from loguru import logger
 from reactivex import Observable, abc
 from reactivex import operators as ops
 from reactivex.disposable import CompositeDisposable, Disposable, SerialDisposable
-from tenacity import (
-    retry,
-    retry_all,
-    retry_if_exception_type,
-    retry_if_not_exception_type,
-    stop_after_delay,
-    wait_exponential,
-)
 
 from blrec.bili.live import Live
 from blrec.core import operators as core_ops
@@ -26,12 +19,15 @@ from blrec.utils import operators as utils_ops
 from blrec.utils.hash import cksum
 from blrec.exception.helpers import format_exception
 
-from ..exceptions import FetchSegmentError, SegmentDataCorrupted
+from ..exceptions import CircuitOpenError, FetchSegmentError, SegmentDataCorrupted
 
 __all__ = ('SegmentFetcher', 'InitSectionData', 'SegmentData')
 
 
-@attr.s(auto_attribs=True, slots=True, frozen=True)
+_RETRIABLE_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True, eq=False)
 class InitSectionData:
     segment: m3u8.Segment
     payload: bytes
@@ -41,7 +37,7 @@ class InitSectionData:
         return len(self.payload)
 
 
-@attr.s(auto_attribs=True, slots=True, frozen=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True, eq=False)
 class SegmentData:
     segment: m3u8.Segment
     payload: bytes
@@ -52,6 +48,12 @@ class SegmentData:
 
 
 class SegmentFetcher:
+    # consecutive failures of a host to trip the breaker and the cool-down
+    # period during which requests to that host fail fast, the cool-down
+    # must outlast the longest backoff delay of _fetch_segment.
+    _BREAKER_THRESHOLD = 5
+    _BREAKER_COOLDOWN = 30.0
+
     def __init__(
         self,
         live: Live,
@@ -61,6 +63,8 @@ class SegmentFetcher:
         self._live = live
         self._session = session
         self._stream_url_resolver = stream_url_resolver
+        self._host_failures: Dict[str, int] = {}
+        self._host_opened_at: Dict[str, float] = {}
 
     def __call__(
         self, source: Observable[m3u8.Segment]
@@ -81,41 +85,44 @@ class SegmentFetcher:
             subscription = SerialDisposable()
 
             attempts: int = 0
-            last_segment: Optional[m3u8.Segment] = None
+            last_init_uri: Optional[str] = None
 
             def on_next(seg: m3u8.Segment) -> None:
-                nonlocal attempts, last_segment
+                nonlocal attempts, last_init_uri
                 url: str = ''
 
                 try:
-                    if hasattr(seg, 'init_section') and (
-                        (
-                            last_segment is None
-                            or seg.init_section != last_segment.init_section
-                        )
-                    ):
-                        url = seg.init_section.absolute_uri
+                    init_section = getattr(seg, 'init_section', None)
+                    if init_section is not None and init_section.uri != last_init_uri:
+                        url = init_section.absolute_uri
                         data = self._fetch_segment(url)
                         while True:
                             time.sleep(1)
                             if (_data := self._fetch_segment(url)) == data:
-                                logger.debug(
+                                # checksums are only computed if debug is enabled
+                                logger.opt(lazy=True).debug(
                                     'Init section checked: '
-                                    f'crc32 of previous data: {cksum(data)}, '
-                                    f'crc32 of current data: {cksum(_data)}, '
-                                    f'init section url: {url}'
+                                    'crc32 of previous data: {}, '
+                                    'crc32 of current data: {}, '
+                                    'init section url: {}',
+                                    lambda: cksum(data),
+                                    lambda: cksum(_data),
+                                    lambda: url,
                                 )
                                 break
                             else:
-                                logger.debug(
+                                logger.opt(lazy=True).debug(
                                     'Init section corrupted: '
-                                    f'crc32 of previous data: {cksum(data)}, '
-                                    f'crc32 of current data: {cksum(_data)}, '
-                                    f'init section url: {url}'
+                                    'crc32 of previous data: {}, '
+                                    'crc32 of current data: {}, '
+                                    'init section url: {}',
+                                    lambda: cksum(data),
+                                    lambda: cksum(_data),
+                                    lambda: url,
                                 )
                                 data = _data
                         observer.on_next(InitSectionData(segment=seg, payload=data))
-                    last_segment = seg
+                        last_init_uri = init_section.uri
 
                     url = seg.absolute_uri
                     hex_size, crc32, *_ = seg.title.split('|')
@@ -125,18 +132,24 @@ class SegmentFetcher:
                         if len(data) != size:
                             logger.debug(
                                 'Segment data incomplete: '
-                                f'size expected: {size}, '
-                                f'size fetched: {len(data)}, '
-                                f'segment url: {url}'
+                                'size expected: {}, '
+                                'size fetched: {}, '
+                                'segment url: {}',
+                                size,
+                                len(data),
+                                url,
                             )
                             continue
                         crc32_of_data = cksum(data)
                         if crc32_of_data != crc32:
                             logger.debug(
                                 'Segment data corrupted: '
-                                f'correct crc32: {crc32}, '
-                                f'crc32 of segment data: {crc32_of_data}, '
-                                f'segment url: {url}'
+                                'correct crc32: {}, '
+                                'crc32 of segment data: {}, '
+                                'segment url: {}',
+                                crc32,
+                                crc32_of_data,
+                                url,
                             )
                             continue
                         break
@@ -156,9 +169,9 @@ class SegmentFetcher:
 
             def dispose() -> None:
                 nonlocal disposed
-                nonlocal last_segment
+                nonlocal last_init_uri
                 disposed = True
-                last_segment = None
+                last_init_uri = None
 
             subscription.disposable = source.subscribe(
                 on_next, observer.on_error, observer.on_completed, scheduler=scheduler
@@ -168,26 +181,58 @@ class SegmentFetcher:
 
         return Observable(subscribe)
 
-    @retry(
-        reraise=True,
-        retry=retry_all(
-            retry_if_exception_type(
-                (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
-            ),
-            retry_if_not_exception_type(requests.exceptions.HTTPError),
-        ),
-        wait=wait_exponential(max=10),
-        stop=stop_after_delay(60),
-    )
     def _fetch_segment(self, url: str) -> bytes:
-        try:
-            response = self._session.get(url, headers=self._live.headers, timeout=5)
-            response.raise_for_status()
-        except Exception as e:
-            logger.debug(f'Failed to fetch segment {url}: {repr(e)}')
-            raise
-        else:
-            return response.content
+        host = urlsplit(url).netloc
+        deadline = time.monotonic() + 60
+        delay = 1.0
+        while True:
+            self._check_breaker(host)
+            try:
+                with self._session.get(
+                    url, stream=True, headers=self._live.headers, timeout=5
+                ) as response:
+                    response.raise_for_status()
+                    # read the whole body at once rather than in small chunks
+                    data = response.raw.read(decode_content=True)
+            except Exception as e:
+                logger.debug('Failed to fetch segment {}: {!r}', url, e)
+                if (
+                    isinstance(e, requests.exceptions.HTTPError)
+                    or not isinstance(e, _RETRIABLE_ERRORS)
+                ):
+                    raise
+                # only connection and timeout failures count against the host
+                tripped = self._record_failure(host)
+                if time.monotonic() >= deadline:
+                    raise
+                if tripped:
+                    # stop retrying a host that keeps failing
+                    raise CircuitOpenError(host) from e
+                time.sleep(delay)
+                delay = min(delay * 2, 10)
+            else:
+                self._record_success(host)
+                return data
+
+    def _check_breaker(self, host: str) -> None:
+        if self._host_failures.get(host, 0) < self._BREAKER_THRESHOLD:
+            return
+        # after the cool-down a request is let through to probe the host,
+        # another failure of it trips the breaker again.
+        if time.monotonic() - self._host_opened_at[host] < self._BREAKER_COOLDOWN:
+            raise CircuitOpenError(host)
+
+    def _record_failure(self, host: str) -> bool:
+        failures = self._host_failures.get(host, 0) + 1
+        self._host_failures[host] = failures
+        if failures >= self._BREAKER_THRESHOLD:
+            self._host_opened_at[host] = time.monotonic()
+            return True
+        return False
+
+    def _record_success(self, host: str) -> None:
+        self._host_failures.pop(host, None)
+        self._host_opened_at.pop(host, None)
 
     def _should_retry(self, exc: Exception) -> bool:
         if isinstance(exc, FetchSegmentError):
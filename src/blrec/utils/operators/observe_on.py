@@ -1,6 +1,6 @@
 from queue import Queue
 from threading import Thread, current_thread
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from loguru import logger
 from reactivex import Observable, abc
@@ -9,6 +9,10 @@ from reactivex.disposable import CompositeDisposable, Disposable, SerialDisposab
 _T = TypeVar('_T')
 
 
+def _noop() -> None:
+    pass
+
+
 def observe_on_new_thread(
     queue_size: Optional[int] = None,
     thread_name: Optional[str] = None,
@@ -21,29 +25,32 @@ def observe_on_new_thread(
         ) -> abc.DisposableBase:
             disposed = False
             subscription = SerialDisposable()
-            queue: Queue[Callable[..., Any]] = Queue(maxsize=queue_size or 0)
+            queue: Queue[Tuple[Callable[..., Any], Tuple[Any, ...]]] = Queue(
+                maxsize=queue_size or 0
+            )
 
             def run() -> None:
                 with logger.contextualize(**(logger_context or {})):
                     while not disposed:
-                        queue.get()()
+                        func, args = queue.get()
+                        func(*args)
 
             thread = Thread(target=run, name=thread_name, daemon=True)
             thread.start()
 
             def on_next(value: _T) -> None:
-                queue.put(lambda: observer.on_next(value))
+                queue.put((observer.on_next, (value,)))
 
             def on_error(exc: Exception) -> None:
-                queue.put(lambda: observer.on_error(exc))
+                queue.put((observer.on_error, (exc,)))
 
             def on_completed() -> None:
-                queue.put(lambda: observer.on_completed)
+                queue.put((observer.on_completed, ()))
 
             def dispose() -> None:
                 nonlocal disposed
                 disposed = True
-                queue.put(lambda: None)
+                queue.put((_noop, ()))
                 if thread is not current_thread():
                     thread.join()
 
@@ -1,5 +1,5 @@
 import time
-from typing import Callable, Iterator, Optional, TypeVar
+from typing import Callable, Iterator, Optional, TypeVar, Union
 
 from reactivex import Observable, abc, catch_with_iterable
 from reactivex import operators as ops
@@ -9,7 +9,7 @@ _T = TypeVar('_T')
 
 def retry(
     count: Optional[int] = None,
-    delay: Optional[float] = None,
+    delay: Union[float, Callable[[], float], None] = None,
     should_retry: Callable[[Exception], bool] = lambda _: True,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     def _retry(source: Observable[_T]) -> Observable[_T]:
@@ -27,7 +27,9 @@ def retry(
                             break
                         if count is not None and n > count:
                             break
-                        if delay:
+                        if callable(delay):
+                            time.sleep(delay())
+                        elif delay:
                             time.sleep(delay)
                     yield n
                     n += 1